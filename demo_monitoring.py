@@ -17,25 +17,28 @@ try:
     from src.agent.firebase_listener import start_firebase_listener, stop_firebase_listener
     from src.agent.tools.databaseTools import _save_flight_search_impl
     from src.agent.MCPLangChainServer import agent
+    from monitoring_lock import acquire_monitoring_lock, release_monitoring_lock, LOCK_FILE
     print("✅ All imports successful")
 except ImportError as e:
     print(f"❌ Import error: {e}")
     sys.exit(1)
 
-# Global variable to track the listener
+# Global variables to track the listener and the monitoring lock
 listener = None
+lock_handle = None
 
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully"""
     print("\n🛑 Received interrupt signal")
     if listener:
         stop_firebase_listener()
+    release_monitoring_lock(lock_handle)
     print("✅ Cleanup completed")
     sys.exit(0)
 
 def main():
     """Run the complete demonstration"""
-    global listener
+    global listener, lock_handle
     
     # Set up signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
@@ -58,6 +61,13 @@ def main():
     
     print("✅ LangChain agent is ready")
     
+    # Don't start a second listener next to a running monitoring service
+    lock_handle = acquire_monitoring_lock()
+    if lock_handle is None:
+        print(f"❌ A monitoring service is already running (lock held on {LOCK_FILE})")
+        print("   Stop it before running the demo")
+        sys.exit(1)
+    
     try:
         # Step 1: Start monitoring
         print("\n📡 Step 1: Starting Firebase monitoring with LangChain agent...")
@@ -101,14 +111,17 @@ def main():
         load_dotenv()
         db_url = os.environ.get('FIREBASE_DATABASE_URL')
         
-        # Check processed results
-        response = requests.get(f'{db_url.rstrip("/")}/processed_searches.json')
+        # Fetch only the newest processed result (push keys sort chronologically)
+        response = requests.get(
+            f'{db_url.rstrip("/")}/processed_searches.json',
+            params={"orderBy": '"$key"', "limitToLast": 1}
+        )
         if response.status_code == 200:
             processed = response.json()
             if processed:
-                print(f"✅ Found {len(processed)} processed result(s) in Firebase")
+                print("✅ Found processed results in Firebase")
                 # Show latest result
-                latest_key = list(processed.keys())[-1]
+                latest_key = max(processed.keys())
                 latest = processed[latest_key]
                 print(f"   Latest processing:")
                 print(f"     Original Search: {latest.get('original_search_id', 'unknown')}")
@@ -135,6 +148,7 @@ def main():
         print(f"\n❌ Error during demo: {str(e)}")
         if listener:
             stop_firebase_listener()
+        release_monitoring_lock(lock_handle)
         sys.exit(1)
 
 if __name__ == "__main__":
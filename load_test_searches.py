@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Load Generator for Flight Search Ingest
+Writes a burst of flight searches to Firebase and reports throughput
+
+Every record lands in flight_searches, so a running start_monitoring.py will
+send each one through the LLM agent and Tavily. Point --db-url at a local
+Firebase emulator unless you really want to load the live database.
+"""
+
+import argparse
+import os
+import sys
+import time
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
+from dotenv import load_dotenv
+
+# Add the parent directory to sys.path so we can import our modules
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir))
+
+# Routes used to generate searches, same cities as the demo data
+ROUTES = [
+    ("Toronto", "Vancouver"),
+    ("Ottawa", "Montreal"),
+    ("Calgary", "Edmonton"),
+    ("Vancouver", "Toronto"),
+    ("Toronto", "Paris")
+]
+
+# Number of records removed per multi-path PATCH during cleanup
+CLEANUP_CHUNK_SIZE = 500
+
+def generate_searches(count, user_prefix):
+    """Build search records with upper-cased city names, like the UI writes them"""
+    searches = []
+    for i in range(count):
+        from_city, to_city = random.choice(ROUTES)
+        searches.append({
+            "to_destination": to_city.upper(),
+            "from_origin": from_city.upper(),
+            "max_price": random.randint(200, 1500),
+            "user_id": f"{user_prefix}{i % 50}"
+        })
+    return searches
+
+def save_search(save_impl, search):
+    """Save one search and return (success, message)"""
+    try:
+        result = save_impl(**search)
+        return "saved successfully" in result, result
+    except Exception as e:
+        return False, str(e)
+
+def cleanup_searches(db_url, user_prefix):
+    """Delete every flight_searches record written by this run, returning how many were removed"""
+    searches_url = f'{db_url.rstrip("/")}/flight_searches.json'
+
+    # Prefer an indexed query on userId, fall back to the whole node if there is no index
+    response = requests.get(searches_url, params={
+        "orderBy": '"userId"',
+        "startAt": f'"{user_prefix}"',
+        "endAt": f'"{user_prefix}\uf8ff"'
+    }, timeout=30)
+    if response.status_code == 400:
+        response = requests.get(searches_url, timeout=30)
+    response.raise_for_status()
+
+    records = response.json() or {}
+    record_ids = [
+        record_id for record_id, record in records.items()
+        if isinstance(record, dict) and str(record.get("userId", "")).startswith(user_prefix)
+    ]
+
+    for i in range(0, len(record_ids), CLEANUP_CHUNK_SIZE):
+        chunk = record_ids[i:i + CLEANUP_CHUNK_SIZE]
+        patch = requests.patch(searches_url, json={record_id: None for record_id in chunk}, timeout=30)
+        patch.raise_for_status()
+
+    return len(record_ids)
+
+def run_load_test(count, workers, db_url, keep_records):
+    """Write `count` searches using `workers` concurrent connections"""
+    # databaseTools reads the database URL from the environment, so set it before importing
+    os.environ["FIREBASE_DATABASE_URL"] = db_url
+    try:
+        from src.agent.tools.databaseTools import _save_flight_search_impl
+        print("✅ Successfully imported database tools")
+    except ImportError as e:
+        print(f"❌ Import error: {e}")
+        sys.exit(1)
+
+    user_prefix = f"load_test_{uuid.uuid4().hex[:8]}_"
+
+    print("🚚 AirReserve Flight Search Load Generator")
+    print("=" * 50)
+    print(f"🔥 Database: {db_url}")
+    print(f"📝 Records: {count}")
+    print(f"🧵 Workers: {workers}")
+    print(f"👤 User prefix: {user_prefix}")
+    print("=" * 50)
+
+    searches = generate_searches(count, user_prefix)
+    succeeded = 0
+    errors = []
+
+    start_time = time.perf_counter()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(save_search, _save_flight_search_impl, search) for search in searches]
+
+            for i, future in enumerate(as_completed(futures), 1):
+                success, message = future.result()
+                if success:
+                    succeeded += 1
+                else:
+                    errors.append(message)
+
+                if i % 100 == 0:
+                    print(f"   {i}/{count} records written...")
+
+        elapsed = time.perf_counter() - start_time
+
+        print("\n📊 LOAD TEST RESULTS")
+        print("=" * 50)
+        print(f"Succeeded: {succeeded}")
+        print(f"Failed: {len(errors)}")
+        print(f"Elapsed: {elapsed:.2f}s")
+        print(f"Throughput: {succeeded / max(elapsed, 1e-9):.1f} records/sec "
+              f"({count / max(elapsed, 1e-9):.1f} attempted/sec)")
+
+        if errors:
+            print("\n❌ First errors:")
+            for message in errors[:5]:
+                print(f"   {message[:100]}")
+
+    finally:
+        if keep_records:
+            print(f"\n💾 Keeping load test records (userId prefix {user_prefix})")
+        else:
+            print("\n🧹 Removing load test records...")
+            try:
+                removed = cleanup_searches(db_url, user_prefix)
+                print(f"✅ Removed {removed} record(s)")
+            except Exception as e:
+                print(f"❌ Cleanup failed: {e}")
+                print(f"   Delete flight_searches records with userId starting {user_prefix} manually")
+
+def main():
+    """Parse arguments, confirm with the user and run the load test"""
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Write a burst of flight searches to Firebase")
+    parser.add_argument("count", type=int, help="Number of flight searches to write")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent writers (default: 8)")
+    parser.add_argument("--db-url", default=os.environ.get("FIREBASE_DATABASE_URL"),
+                        help="Database URL, e.g. a local emulator (default: FIREBASE_DATABASE_URL)")
+    parser.add_argument("--keep", action="store_true", help="Don't delete the records afterwards")
+    parser.add_argument("--yes", action="store_true", help="Skip the confirmation prompt")
+    args = parser.parse_args()
+
+    if args.count < 1 or args.workers < 1:
+        parser.error("count and --workers must be positive")
+    if not args.db_url:
+        parser.error("no database URL: pass --db-url or set FIREBASE_DATABASE_URL")
+
+    if not args.yes:
+        print(f"⚠️  About to write {args.count} flight searches to {args.db_url}")
+        print("   A running monitoring service will call the LLM agent and Tavily for each one.")
+        if input("Type 'yes' to continue: ").strip().lower() != "yes":
+            print("🛑 Aborted")
+            sys.exit(1)
+
+    run_load_test(args.count, args.workers, args.db_url, args.keep)
+
+if __name__ == "__main__":
+    main()
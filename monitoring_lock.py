@@ -0,0 +1,44 @@
+"""
+Monitoring Service Lock
+Makes sure only one Firebase listener runs per checkout at a time
+"""
+
+import os
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+# Anchored to this file so every entry point shares one lock, whatever the working directory
+LOCK_FILE = Path(__file__).parent / "data" / "firebase_monitoring.lock"
+
+def acquire_monitoring_lock():
+    """Take an exclusive lock on LOCK_FILE, returning the open handle or None if held elsewhere"""
+    LOCK_FILE.parent.mkdir(exist_ok=True)
+    lock_handle = open(LOCK_FILE, 'a')
+
+    if fcntl is None:
+        return lock_handle
+
+    try:
+        fcntl.flock(lock_handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_handle.close()
+        return None
+
+    # The OS drops the lock if this process dies, so a restarted service can take over
+    lock_handle.truncate(0)
+    lock_handle.write(str(os.getpid()))
+    lock_handle.flush()
+    return lock_handle
+
+def release_monitoring_lock(lock_handle):
+    """Release a lock returned by acquire_monitoring_lock"""
+    if lock_handle is None or lock_handle.closed:
+        return
+
+    if fcntl is not None:
+        fcntl.flock(lock_handle, fcntl.LOCK_UN)
+    lock_handle.close()
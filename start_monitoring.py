@@ -16,6 +16,7 @@ sys.path.insert(0, str(parent_dir))
 try:
     from src.agent.firebase_listener import start_firebase_listener, stop_firebase_listener
     from src.agent.MCPLangChainServer import agent
+    from monitoring_lock import acquire_monitoring_lock, release_monitoring_lock, LOCK_FILE
     print("✅ Successfully imported Firebase listener and LangChain agent")
 except ImportError as e:
     print(f"❌ Error importing Firebase listener: {e}")
@@ -39,6 +40,12 @@ def main():
     
     print("✅ LangChain agent is ready")
     
+    lock_handle = acquire_monitoring_lock()
+    if lock_handle is None:
+        print(f"❌ Another monitoring service is already running (lock held on {LOCK_FILE})")
+        print("   Stop it first, or wait for it to exit")
+        sys.exit(1)
+    
     # Get poll interval from command line or use default
     poll_interval = 5
     if len(sys.argv) > 1:
@@ -68,6 +75,8 @@ def main():
         print(f"❌ Unexpected error: {str(e)}")
         stop_firebase_listener()
         sys.exit(1)
+    finally:
+        release_monitoring_lock(lock_handle)
 
 if __name__ == "__main__":
     main()
@@ -17,94 +17,238 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from agent.real_time_data_manager import RealTimeDataManager
 
+NOTIFICATION_CONFIG_PATH = "config/notification_config.json"
+DEFAULT_THRESHOLD = 200  # used when the config doesn't set one
+
+# Discord accepts at most 10 embeds in a single webhook message
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_ATTEMPTS = 3
+
+def flight_key(flight):
+    """Return a key that identifies the same fare across refreshes
+    
+    Flights with a flight_number are keyed on it, so their price changes can be
+    tracked. Other flights are keyed on the whole fare including its price, so a
+    repriced fare shows up as one removed flight plus one new flight.
+    """
+    if flight.get('flight_number'):
+        return ('flight_number', flight['flight_number'])
+    return ('fare', flight.get('airline'), flight.get('departure'), flight.get('destination'),
+            flight.get('timestamp'), flight.get('price'))
+
+def validate_notification_config(config):
+    """Raise ValueError unless the fields the monitor reads have usable types"""
+    if not isinstance(config, dict):
+        raise ValueError("config must be a JSON object")
+    
+    for field in ("threshold", "check_interval"):
+        value = config.get(field)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise ValueError(f"{field} must be a number")
+    
+    channels = config.get("notification_channels")
+    if channels is not None and not isinstance(channels, list):
+        raise ValueError("notification_channels must be a list")
+
 class NotificationTester:
     """Test class to simulate notifications and verify functionality"""
     
     def __init__(self):
         self.notifications_sent = []
         self.price_drops_detected = 0
+        self.seen_flights = {}  # flight key -> flight as of the last refresh
+        self.session = requests.Session()  # reuse the webhook connection between sends
+        self.config = None
+        self.config_signature = None
         
     async def test_notification_callback(self, flight_data):
         """Callback function to test notifications"""
         print(f"🔔 Notification callback triggered with {len(flight_data)} flights")
         
         # Check for price drops below threshold
-        threshold = 200  # From config
-        for flight in flight_data:
-            if flight.get('price', 0) < threshold:
+        config = self.load_notification_config() or {}
+        threshold = config.get('threshold', DEFAULT_THRESHOLD)
+        current_flights = {flight_key(flight): flight for flight in flight_data}
+        new_flights = []
+        price_changes = []
+        price_drops = []
+        
+        for key, flight in current_flights.items():
+            price = flight.get('price', 0)
+            previous_flight = self.seen_flights.get(key)
+            previous_price = previous_flight.get('price', 0) if previous_flight else None
+            
+            if previous_price is None:
+                new_flights.append(flight)
+            elif price != previous_price:
+                price_changes.append((flight, previous_price, price))
+                print(f"💱 Price change: {flight.get('airline', 'Unknown')} ${previous_price} → ${price}")
+            else:
+                # Already seen at this price, don't alert again
+                continue
+            
+            # Only alert on flights under the threshold that got cheaper (or are new)
+            if price < threshold and (previous_price is None or price < previous_price):
                 self.price_drops_detected += 1
                 notification = {
                     "timestamp": datetime.now().isoformat(),
                     "type": "price_drop",
                     "flight": flight,
+                    "previous_price": previous_price,
                     "threshold": threshold
                 }
                 self.notifications_sent.append(notification)
-
-                # Send Discord notification
-                await self.send_discord_notification(flight)
+                price_drops.append(flight)
                 
-                print(f"🚨 PRICE DROP ALERT: ${flight.get('price')} for {flight.get('airline', 'Unknown')}")
+                print(f"🚨 PRICE DROP ALERT: ${price} for {flight.get('airline', 'Unknown')}")
+        
+        removed_flights = [flight for key, flight in self.seen_flights.items() if key not in current_flights]
+        for flight in removed_flights:
+            print(f"🗑️  Flight no longer listed: {flight.get('airline', 'Unknown')} at ${flight.get('price')}")
         
-        print(f"📊 Current stats: {self.price_drops_detected} price drops detected")
+        # Keep only flights from this refresh so the map doesn't grow without bound
+        self.seen_flights = current_flights
+        
+        # Send all drops from this refresh together instead of one webhook call each
+        if price_drops:
+            await self.send_notifications(price_drops)
+        
+        print(f"📊 Current stats: {len(new_flights)} new, {len(price_changes)} repriced, "
+              f"{len(removed_flights)} removed, {self.price_drops_detected} price drops detected")
 
-    async def send_discord_notification(self, flight):
-        """Send notification to Discord webhook"""
+    def load_notification_config(self):
+        """Return the notification config, re-reading the file only when it changes"""
         try:
-            # Load Discord webhook URL from config
-            config_path = "config/notification_config.json"
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
+            stat = os.stat(NOTIFICATION_CONFIG_PATH)
+        except OSError:
+            # The file can briefly vanish while an editor replaces it
+            return self.config
+        
+        # mtime alone can miss two writes inside one timestamp tick, so compare size too
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self.config_signature:
+            try:
+                with open(NOTIFICATION_CONFIG_PATH, 'r') as f:
                     config = json.load(f)
-                
-                webhook_url = config.get('discord_webhook_url', '')
-                if not webhook_url or webhook_url == 'your_discord_webhook_url_here':
-                    print("⚠️  Discord webhook not configured")
-                    return
-                
-                # Create Discord message
-                embed = {
-                    "title": "🚨 Flight Price Drop Alert!",
-                    "description": f"**Price Drop Detected!**\n\n"
-                                 f"💰 **Price:** ${flight.get('price', 'Unknown')}\n"
-                                 f"✈️ **Airline:** {flight.get('airline', 'Unknown')}\n"
-                                 f"🛫 **Route:** {flight.get('departure', 'Unknown')} → {flight.get('destination', 'Unknown')}\n"
-                                 f"⏰ **Detected:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    "color": 0xFF0000,  # Red color
-                    "footer": {
-                        "text": "AirReserve Price Monitor"
-                    },
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                payload = {
-                    "embeds": [embed],
-                    "content": "🔔 **PRICE DROP ALERT!** Check out this great deal!"
-                }
-                
+                validate_notification_config(config)
+            except (OSError, ValueError) as e:
+                # Keep serving the last good config while the file is mid-edit
+                print(f"⚠️  Could not reload notification config: {e}")
+                return self.config
+            
+            self.config = config
+            self.config_signature = signature
+        
+        return self.config
+
+    def build_discord_embed(self, flight):
+        """Build the Discord embed for a single price drop"""
+        return {
+            "title": "🚨 Flight Price Drop Alert!",
+            "description": f"**Price Drop Detected!**\n\n"
+                         f"💰 **Price:** ${flight.get('price', 'Unknown')}\n"
+                         f"✈️ **Airline:** {flight.get('airline', 'Unknown')}\n"
+                         f"🛫 **Route:** {flight.get('departure', 'Unknown')} → {flight.get('destination', 'Unknown')}\n"
+                         f"⏰ **Detected:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "color": 0xFF0000,  # Red color
+            "footer": {
+                "text": "AirReserve Price Monitor"
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+
+    async def post_discord_message(self, webhook_url, payload):
+        """Post one webhook message off the event loop, waiting out Discord rate limits"""
+        loop = asyncio.get_running_loop()
+        
+        for attempt in range(DISCORD_MAX_ATTEMPTS):
+            response = await loop.run_in_executor(
+                None, lambda: self.session.post(webhook_url, json=payload, timeout=10)
+            )
+            
+            if response.status_code != 429:
+                # Pause before the next message if this one used up the bucket
+                if response.headers.get('X-RateLimit-Remaining') == '0':
+                    await asyncio.sleep(float(response.headers.get('X-RateLimit-Reset-After', 1)))
+                return response
+            
+            if attempt == DISCORD_MAX_ATTEMPTS - 1:
+                break
+            
+            retry_after = float(response.headers.get('Retry-After', 1))
+            print(f"⏸️  Discord rate limited, retrying in {retry_after}s")
+            await asyncio.sleep(retry_after)
+        
+        return response
+
+    async def send_notifications(self, flights):
+        """Send price drops to Discord webhook, up to 10 embeds per message
+        
+        Returns one {"flight", "sent", "status"} entry per flight, in input order.
+        """
+        # Load Discord webhook URL from config
+        config = self.load_notification_config()
+        if config is None:
+            if os.path.exists(NOTIFICATION_CONFIG_PATH):
+                print("❌ Notification config is invalid")
+            else:
+                print("❌ Notification config file not found")
+            return [{"flight": flight, "sent": False, "status": "config_missing"} for flight in flights]
+        
+        webhook_url = config.get('discord_webhook_url', '')
+        if not webhook_url or webhook_url == 'your_discord_webhook_url_here':
+            print("⚠️  Discord webhook not configured")
+            return [{"flight": flight, "sent": False, "status": "not_configured"} for flight in flights]
+        
+        results = []
+        for i in range(0, len(flights), DISCORD_MAX_EMBEDS):
+            batch = flights[i:i + DISCORD_MAX_EMBEDS]
+            payload = {
+                "embeds": [self.build_discord_embed(flight) for flight in batch],
+                "content": "🔔 **PRICE DROP ALERT!** Check out this great deal!"
+            }
+            
+            try:
                 # Send to Discord
-                response = requests.post(webhook_url, json=payload, timeout=10)
+                response = await self.post_discord_message(webhook_url, payload)
+                sent = response.status_code == 204
+                status = response.status_code
                 
-                if response.status_code == 204:
-                    print(f"✅ Discord notification sent successfully!")
+                if sent:
+                    print(f"✅ Discord notification sent successfully! ({len(batch)} price drops)")
                 else:
                     print(f"❌ Discord notification failed: {response.status_code} - {response.text}")
                     
-            else:
-                print("❌ Notification config file not found")
-                
-        except Exception as e:
-            print(f"❌ Error sending Discord notification: {e}")
+            except Exception as e:
+                print(f"❌ Error sending Discord notification: {e}")
+                sent = False
+                status = str(e)
+            
+            results.extend({"flight": flight, "sent": sent, "status": status} for flight in batch)
+        
+        return results
+
+    def close(self):
+        """Close the pooled webhook session"""
+        self.session.close()
 
 async def test_real_time_data_manager():
     """Test the RealTimeDataManager functionality"""
     
+    notification_tester = NotificationTester()
+    try:
+        return await run_data_manager_tests(notification_tester)
+    finally:
+        notification_tester.close()
+
+async def run_data_manager_tests(notification_tester):
+    """Run the RealTimeDataManager checks using the given notification tester"""
+    
     print("🚀 Testing Issue 3: LangChain Asynchronous Agent")
     print("=" * 60)
     
     # Initialize the data manager
     data_manager = RealTimeDataManager(data_dir="data", refresh_interval=60)
-    notification_tester = NotificationTester()
     
     print("📋 Test 1: Loading existing flight data")
     print("-" * 40)
@@ -209,12 +353,9 @@ async def test_real_time_data_manager():
     print("-" * 40)
     
     try:
-        # Check if notification config exists
-        config_path = "config/notification_config.json"
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            
+        # Check if notification config exists and is valid
+        config = notification_tester.load_notification_config()
+        if config is not None:
             print("✅ Notification configuration found:")
             print(f"   💰 Price threshold: ${config.get('threshold', 'Not set')}")
             print(f"   ⏱️  Check interval: {config.get('check_interval', 'Not set')} seconds")
@@ -227,6 +368,9 @@ async def test_real_time_data_manager():
             else:
                 print("   🔗 Discord webhook: Not configured")
                 
+        elif os.path.exists(NOTIFICATION_CONFIG_PATH):
+            print("❌ Notification configuration is invalid")
+            return False
         else:
             print("❌ Notification configuration not found")
             return False
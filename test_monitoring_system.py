@@ -16,6 +16,7 @@ sys.path.insert(0, str(current_dir))
 try:
     from src.agent.firebase_listener import start_firebase_listener, stop_firebase_listener, get_firebase_listener
     from src.agent.tools.databaseTools import _save_flight_search_impl
+    from monitoring_lock import acquire_monitoring_lock, release_monitoring_lock, LOCK_FILE
     print("✅ All imports successful")
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -104,6 +105,12 @@ def test_firebase_monitoring():
     print("\n📡 Testing Firebase Monitoring System with LangChain Agent")
     print("-" * 55)
     
+    # Don't start a second listener next to a running monitoring service
+    lock_handle = acquire_monitoring_lock()
+    if lock_handle is None:
+        print(f"⏭️  A monitoring service is already running (lock held on {LOCK_FILE}) - skipping monitoring test")
+        return None  # reported as skipped, not failed
+    
     try:
         # Import agent from MCP server
         from src.agent.MCPLangChainServer import agent
@@ -160,6 +167,8 @@ def test_firebase_monitoring():
         except:
             pass
         return False
+    finally:
+        release_monitoring_lock(lock_handle)
 
 def run_full_test():
     """Run the complete test suite"""
@@ -190,15 +199,22 @@ def run_full_test():
     print("=" * 50)
     
     passed = 0
-    total = len(results)
+    skipped = 0
     
     for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        if result is None:
+            status = "⏭️  SKIP"
+            skipped += 1
+        else:
+            status = "✅ PASS" if result else "❌ FAIL"
         print(f"{status}: {test_name}")
         if result:
             passed += 1
     
+    total = len(results) - skipped
     print(f"\nOverall: {passed}/{total} tests passed")
+    if skipped:
+        print(f"⏭️  {skipped} test(s) skipped")
     
     if passed == total:
         print("\n🎉 All tests passed! Your monitoring system is ready to use.")
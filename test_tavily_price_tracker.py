@@ -6,6 +6,7 @@ Tests the functionality with sample routes as specified in Issue 2 task list
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Add the src directory to Python path
@@ -13,6 +14,42 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from agent.tools.tavily_price_tracker import tavily_price_tracker
 
+# Upper bound on simultaneous Tavily searches to stay within the API rate limit
+MAX_CONCURRENT_SEARCHES = 4
+
+def run_price_search(test_case):
+    """Run a single route search and return its test result"""
+    
+    try:
+        # Call the tool function with individual parameters using invoke
+        params = test_case['params']
+        result = tavily_price_tracker.invoke({
+            "from_city": params["FROM"],
+            "to_city": params["TO"], 
+            "max_price": str(params["maxPrice"])
+        })
+        
+        return {
+            "test_name": test_case['name'],
+            "params": test_case['params'],
+            "result": result,
+            "success": "Error:" not in result[:10],  # Simple success check
+            "timestamp": datetime.now().isoformat()
+        }
+        
+    except Exception as e:
+        return {
+            "test_name": test_case['name'],
+            "params": test_case['params'],
+            "result": f"❌ Test failed with exception: {str(e)}",
+            "success": False,
+            "timestamp": datetime.now().isoformat()
+        }
+
+def run_route_group(group):
+    """Run the (index, test_case) pairs for one route one after another"""
+    return [(index, run_price_search(test_case)) for index, test_case in group]
+
 def test_flight_price_tracker():
     """Test the Tavily price tracker with sample routes"""
     
@@ -39,47 +76,34 @@ def test_flight_price_tracker():
         }
     ]
     
-    results = []
-    
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n📋 Test {i}: {test_case['name']}")
-        print(f"   Parameters: {test_case['params']}")
-        print("-" * 40)
+    # Group cases by route: the tracker rewrites one data file per route, so
+    # searches on the same route must not run at the same time
+    route_groups = {}
+    for index, test_case in enumerate(test_cases):
+        params = test_case['params']
+        route_key = (params["FROM"].strip().lower(), params["TO"].strip().lower())
+        route_groups.setdefault(route_key, []).append((index, test_case))
+    
+    # Search different routes concurrently and report each result as its route finishes
+    completed = []
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SEARCHES) as executor:
+        futures = [executor.submit(run_route_group, group) for group in route_groups.values()]
         
-        try:
-            # Call the tool function with individual parameters using invoke
-            params = test_case['params']
-            result = tavily_price_tracker.invoke({
-                "from_city": params["FROM"],
-                "to_city": params["TO"], 
-                "max_price": str(params["maxPrice"])
-            })
-            
-            # Store result
-            test_result = {
-                "test_name": test_case['name'],
-                "params": test_case['params'],
-                "result": result,
-                "success": "Error:" not in result[:10],  # Simple success check
-                "timestamp": datetime.now().isoformat()
-            }
-            results.append(test_result)
-            
-            # Display result
-            print(f"✅ Result: {result}")
-            
-        except Exception as e:
-            error_msg = f"❌ Test failed with exception: {str(e)}"
-            print(error_msg)
-            
-            test_result = {
-                "test_name": test_case['name'],
-                "params": test_case['params'],
-                "result": error_msg,
-                "success": False,
-                "timestamp": datetime.now().isoformat()
-            }
-            results.append(test_result)
+        for future in as_completed(futures):
+            for index, test_result in future.result():
+                completed.append((index, test_result))
+                
+                print(f"\n📋 Finished {len(completed)}/{len(test_cases)}: {test_result['test_name']}")
+                print(f"   Parameters: {test_result['params']}")
+                print("-" * 40)
+                
+                if test_result['success']:
+                    print(f"✅ Result: {test_result['result']}")
+                else:
+                    print(test_result['result'])
+    
+    # Report in test case order rather than completion order
+    results = [test_result for _, test_result in sorted(completed, key=lambda item: item[0])]
     
     # Summary
     print("\n" + "=" * 50)